@@ -1,23 +1,76 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from dataclasses import dataclass, field
-import heapq
 import time
-import csv
 import os
 import random
 import threading
-from typing import List, Tuple
+import warnings
+from array import array
+from bisect import insort
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # -------------------------
 # Desktop export path (confirmed)
 # -------------------------
 DESKTOP_PATH = "/Users/nitinsaimac/Desktop"
 
+# Rows rendered in the queue listbox; only the highest-priority patients are shown.
+QUEUE_VIEW_LIMIT = 50
+
+# Minimum seconds between simulation progress updates posted to the GUI (~60 Hz).
+PROGRESS_INTERVAL = 0.016
+
+# -------------------------
+# Timestamp formatting cache
+# -------------------------
+_TIME_CACHE_MAX = 4096
+_TIME_CACHE: Dict[int, str] = {}
+
+def _fmt_time(ts: float) -> str:
+    # Queue redraws and snapshot exports format the same booking seconds over and over, so
+    # formatted strings are reused; the cache is simply emptied when full. Each dict operation is
+    # atomic under the GIL, so no lock is needed. Streams of mostly distinct seconds, like the
+    # simulation export, should call strftime directly instead.
+    k = int(ts)
+    s = _TIME_CACHE.get(k)
+    if s is None:
+        s = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(k))
+        if len(_TIME_CACHE) >= _TIME_CACHE_MAX:
+            _TIME_CACHE.clear()
+        _TIME_CACHE[k] = s
+    return s
+
+# -------------------------
+# Priority key packing
+# -------------------------
+# Priority lanes packed into one integer, most significant first:
+# 4 bits severity+appointment boost, 4 bits urgency, 1 bit age group,
+# 28 bits booking offset (seconds), 20 bits patient id.
+_PID_BITS = 20
+_OFFSET_BITS = 28
+_PID_MASK = (1 << _PID_BITS) - 1
+_LANE_MAX = 15
+
+def _pack_priority(score: int, urgency: int, age_priority: int, offset: int, pid: int,
+                   pid_bits: int = _PID_BITS, offset_bits: int = _OFFSET_BITS) -> int:
+    low = pid_bits + offset_bits
+    return (((15 - score) << (low + 5)) | ((15 - urgency) << (low + 1)) | ((1 - age_priority) << low)
+            | (offset << pid_bits) | pid)
+
+# Appointment types double as their priority boost (walk-in 0, appointment 1, emergency 2).
+APPT_TYPES = ("walk-in", "appointment", "emergency")
+APPT_BOOST = {appt: boost for boost, appt in enumerate(APPT_TYPES)}
+
+# Booking times are stored relative to this base, centred on start-up so that
+# bookings up to ~4 years either side of it fit in the offset lane.
+_OFFSET_MAX = (1 << _OFFSET_BITS) - 1
+EPOCH_BASE = int(time.time()) - (1 << (_OFFSET_BITS - 1))
+
 # -------------------------
 # Data model
 # -------------------------
-@dataclass(order=False)
+@dataclass(order=False, slots=True)
 class Patient:
     id: int
     name: str
@@ -27,116 +80,260 @@ class Patient:
     booking_time: float
     appointment_type: str = "walk-in"
     notes: str = ""
-    priority_tuple: Tuple = field(default=None, compare=False)
+    priority_key: Optional[int] = field(default=None, compare=False)
 
-    def compute_priority(self) -> Tuple:
+    def compute_priority(self) -> int:
+        # Priority inputs never change after creation, so the key is computed once and reused.
+        if self.priority_key is not None:
+            return self.priority_key
         age_priority = 1 if self.age < 12 or self.age >= 60 else 0
-        appt_boost = 2 if self.appointment_type.lower() == "emergency" else (1 if self.appointment_type.lower() == "appointment" else 0)
-        tup = (-(self.severity + appt_boost), -self.urgency, -age_priority, self.booking_time, self.id)
-        self.priority_tuple = tup
-        return tup
+        appt_boost = APPT_BOOST.get(self.appointment_type.lower(), 0)
+        score = self.severity + appt_boost
+        offset = int(self.booking_time) - EPOCH_BASE
+        # Every lane must fit its bit width, otherwise it would bleed into the lanes above it.
+        if not 0 <= score <= _LANE_MAX:
+            raise ValueError(f"severity {self.severity} out of range for the priority key")
+        if not 0 <= self.urgency <= _LANE_MAX:
+            raise ValueError(f"urgency {self.urgency} out of range for the priority key")
+        if not 0 <= offset <= _OFFSET_MAX:
+            raise ValueError(f"booking_time {self.booking_time} is outside the supported range (~4 years around start-up)")
+        if not 0 <= self.id <= _PID_MASK:
+            raise ValueError(f"patient id {self.id} exceeds {_PID_MASK}")
+        key = _pack_priority(score, self.urgency, age_priority, offset, self.id)
+        self.priority_key = key
+        return key
 
     def summary(self) -> str:
-        bt = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.booking_time))
-        return f"[{self.id}] {self.name} | Age:{self.age} | Sev:{self.severity} | Urg:{self.urgency} | {self.appointment_type} | {bt}"
+        return f"[{self.id}] {self.name} | Age:{self.age} | Sev:{self.severity} | Urg:{self.urgency} | {self.appointment_type} | {_fmt_time(self.booking_time)}"
 
 # -------------------------
 # Real-time priority queue
 # -------------------------
 class HospitalQueue:
     def __init__(self):
-        self._heap = []
+        # (-priority_key, patient) entries in ascending order, i.e. lowest priority first, so the
+        # next patient is always at the end: pop/peek are O(1) and views never have to sort.
+        # The trade-off is that each add is O(n) (bisect plus a list memmove) instead of a heap's
+        # O(log n); that is cheap at reception-desk queue sizes but not for very large bulk adds,
+        # which should go through bulk_load.
+        self._queue = []
         self._id_counter = 0
+        # Bumped whenever the contents are replaced, so an add that straddles a clear can tell.
+        self._generation = 0
         self._lock = threading.Lock()
 
     def add_patient(self, name: str, age: int, severity: int, urgency: int,
                     appointment_type: str = "walk-in", notes: str = "", booking_time: float = None) -> Patient:
         if booking_time is None:
             booking_time = time.time()
+        # Only the id allocation and the queue insert need the lock; the patient and its key are built
+        # outside it. If the queue was cleared or reloaded in between, the id may be reused, so retry.
+        while True:
+            with self._lock:
+                self._id_counter += 1
+                pid, generation = self._id_counter, self._generation
+            p = Patient(pid, name, age, severity, urgency, booking_time, appointment_type, notes)
+            entry = (-p.compute_priority(), p)
+            with self._lock:
+                if self._generation == generation:
+                    insort(self._queue, entry)
+                    return p
+
+    def bulk_load(self, rows: Iterable[Tuple], booking_time: float = None) -> List[Patient]:
+        # Replaces the queue contents, like clear() followed by one add_patient per row, but with a
+        # single sort instead of n inserts. Rows are (name, age, severity, urgency[, appointment_type[, notes]]).
+        if booking_time is None:
+            booking_time = time.time()
+        patients = [self._patient_from_row(pid, booking_time, row) for pid, row in enumerate(rows, 1)]
+        entries = sorted((-p.compute_priority(), p) for p in patients)
         with self._lock:
-            self._id_counter += 1
-            p = Patient(self._id_counter, name, age, severity, urgency, booking_time, appointment_type, notes)
-            heapq.heappush(self._heap, (p.compute_priority(), p))
-            return p
+            self._queue = entries
+            self._id_counter = len(patients)
+            self._generation += 1
+        return patients
+
+    @staticmethod
+    def _patient_from_row(pid: int, booking_time: float, row: Tuple) -> Patient:
+        if not 4 <= len(row) <= 6:
+            raise ValueError(f"bulk_load rows need 4 to 6 fields, got {len(row)}: {row!r}")
+        name, age, severity, urgency, *rest = row
+        appointment_type = rest[0] if rest else "walk-in"
+        notes = rest[1] if len(rest) > 1 else ""
+        return Patient(pid, name, age, severity, urgency, booking_time, appointment_type, notes)
 
     def pop_next(self) -> Patient:
         with self._lock:
-            if not self._heap:
-                return None
-            return heapq.heappop(self._heap)[1]
+            return self._queue.pop()[1] if self._queue else None
 
     def peek_next(self) -> Patient:
         with self._lock:
-            return self._heap[0][1] if self._heap else None
+            return self._queue[-1][1] if self._queue else None
 
     def list_queue(self) -> List[Patient]:
         with self._lock:
-            for _, p in self._heap:
-                p.compute_priority()
-            return [p for _, p in sorted(self._heap, key=lambda x: x[0])]
+            return [p for _, p in reversed(self._queue)]
 
-    def size(self) -> int:
+    def top_k(self, k: int) -> List[Patient]:
         with self._lock:
-            return len(self._heap)
+            return [p for _, p in reversed(self._queue[-k:])] if k > 0 else []
+
+    def size(self) -> int:
+        # len() of a list is atomic under the GIL, so no lock round-trip is needed.
+        return len(self._queue)
 
     def clear(self):
         with self._lock:
-            self._heap = []
+            self._queue = []
             self._id_counter = 0
+            self._generation += 1
+
+# -------------------------
+# Simulation queue (structure-of-arrays)
+# -------------------------
+
+# Simulation keys are never compared with live-queue keys, so the id and offset lanes are sized
+# per run: the id lane is just wide enough for the capacity and the offset lane takes the rest
+# of the 54 low bits, keeping keys within a signed 64-bit array slot.
+_SIM_LOW_BITS = 54
+
+class SimulatedQueue:
+    """Array-backed queue for simulation runs: all arrivals are loaded before any is serviced,
+    so the service order is one sort over packed integer keys instead of heap pushes/pops."""
+
+    def __init__(self, capacity: int, base_time: float):
+        # Simulated severities (1-4) and urgencies (1-10) always fit their lanes.
+        self._pid_bits = max(capacity.bit_length(), 1)
+        self._offset_bits = _SIM_LOW_BITS - self._pid_bits
+        self._pid_mask = (1 << self._pid_bits) - 1
+        self.base_time = base_time
+        self._n = 0
+        self._ages = array("h", [0]) * capacity
+        self._severities = array("b", [0]) * capacity
+        self._urgencies = array("b", [0]) * capacity
+        self._appt_codes = array("b", [0]) * capacity
+        self._offsets = array("q", [0]) * capacity
+        self._keys = array("q", [0]) * capacity
+        self._order = None
+
+    def extend(self, ages: List[int], severities: List[int], urgencies: List[int],
+               appt_codes: List[int], offsets: List[int]):
+        start, end = self._n, self._n + len(ages)
+        if end > len(self._keys):
+            raise ValueError(f"SimulatedQueue capacity {len(self._keys)} exceeded")
+        if offsets and not (min(offsets) >= 0 and max(offsets) < (1 << self._offset_bits)):
+            raise ValueError(f"arrival span of {max(offsets)} seconds is too long for {len(self._keys)} arrivals")
+        self._ages[start:end] = array("h", ages)
+        self._severities[start:end] = array("b", severities)
+        self._urgencies[start:end] = array("b", urgencies)
+        self._appt_codes[start:end] = array("b", appt_codes)
+        self._offsets[start:end] = array("q", offsets)
+        pid_bits, offset_bits = self._pid_bits, self._offset_bits
+        self._keys[start:end] = array("q", [
+            _pack_priority(sev + code, urg, 1 if age < 12 or age >= 60 else 0, off, pid, pid_bits, offset_bits)
+            for pid, age, sev, urg, code, off in zip(range(start + 1, end + 1), ages, severities, urgencies, appt_codes, offsets)])
+        self._n = end
+        self._order = None
+
+    def patient(self, pid: int) -> Patient:
+        i = pid - 1
+        return Patient(pid, f"P{pid}", self._ages[i], self._severities[i], self._urgencies[i],
+                       self.base_time + self._offsets[i], APPT_TYPES[self._appt_codes[i]])
+
+    def pop_next(self) -> Patient:
+        if self._order is None:
+            # Reverse order so each pop is O(1) from the end of the list.
+            self._order = sorted(self._keys[:self._n], reverse=True)
+        if not self._order:
+            return None
+        return self.patient(self._order.pop() & self._pid_mask)
+
+    def size(self) -> int:
+        return self._n if self._order is None else len(self._order)
 
 # -------------------------
 # Export utility
 # -------------------------
+def _csv_escape(value: str) -> str:
+    # Same quoting csv.writer applies by default (QUOTE_MINIMAL), for free-text fields only.
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def _write_csv(filepath: str, header: List[str], lines: List[str]):
+    # Lines are pre-formatted and written in one call through a large buffer, with the
+    # \r\n terminator csv.writer would use.
+    with open(filepath, "w", newline="", buffering=1 << 20) as f:
+        f.write("\r\n".join([",".join(header), *lines, ""]))
+
 def export_patients_to_csv(patients: List[Patient], filename: str):
     filepath = os.path.join(DESKTOP_PATH, filename)
-    with open(filepath, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["id", "name", "age", "severity", "urgency", "appointment_type", "booking_time"])
-        for p in patients:
-            writer.writerow([p.id, p.name, p.age, p.severity, p.urgency, p.appointment_type,
-                             time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(p.booking_time))])
+    lines = [f"{p.id},{_csv_escape(p.name)},{p.age},{p.severity},{p.urgency},{_csv_escape(p.appointment_type)},"
+             f"{_fmt_time(p.booking_time)}" for p in patients]
+    _write_csv(filepath, ["id", "name", "age", "severity", "urgency", "appointment_type", "booking_time"], lines)
     return filepath
 
 # -------------------------
 # Simulation logic
 # -------------------------
-def simulate_live_and_export(hq: HospitalQueue, how_many=30, doctors=2, arrival_interval=(1,4),
-                             export_name="simulation_serviced.csv", progress_callback=None, seed=None):
-    rng = random.Random(seed) if seed is not None else random.Random()
-    now = time.time()
-    for i in range(how_many):
-        name = f"P{i+1}"
-        age = rng.randint(1, 90)
-        severity = rng.choices([1,2,3,4], weights=[40,30,20,10])[0]
-        urgency = rng.randint(1, 10)
-        appt = rng.choices(["walk-in", "appointment", "emergency"], weights=[60,30,10])[0]
-        booking_time = now + i * rng.randint(*arrival_interval)
-        hq.add_patient(name, age, severity, urgency, appt, "", booking_time=booking_time)
+_SEVERITIES = (1, 2, 3, 4)
+_SEVERITY_CUM_WEIGHTS = (40, 70, 90, 100)
+_APPT_CODES = (0, 1, 2)
+_APPT_CUM_WEIGHTS = (60, 90, 100)
+
+def _generate_arrivals(hq: SimulatedQueue, how_many: int, rng: random.Random, arrival_interval, progress_callback=None):
+    # Each column is drawn in one batched choices() call and loaded into the queue at once.
+    choices = rng.choices
+    lo, hi = arrival_interval
+    ages = choices(range(1, 91), k=how_many)
+    severities = choices(_SEVERITIES, cum_weights=_SEVERITY_CUM_WEIGHTS, k=how_many)
+    urgencies = choices(range(1, 11), k=how_many)
+    appt_codes = choices(_APPT_CODES, cum_weights=_APPT_CUM_WEIGHTS, k=how_many)
+    gaps = choices(range(lo, hi + 1), k=how_many)
+    hq.extend(ages, severities, urgencies, appt_codes, [i * g for i, g in enumerate(gaps)])
+    if progress_callback:
+        try: progress_callback(how_many, how_many)
+        except Exception: pass
+
+def _service_arrivals(hq: SimulatedQueue, start_time: float, rng: random.Random, progress_callback=None):
+    # Doctors share a single service clock, so servicing is one sequential pass in priority
+    # order with every consultation length drawn up front. The batched draw consumes the random
+    # stream differently from per-patient randint(3, 8), so the same seed gives different wait
+    # times than it did before this pass was batched.
+    total = hq.size()
+    pop_next = hq.pop_next
+    serviced = []
+    current_time = start_time
+    for duration in rng.choices(range(3, 9), k=total):
+        p = pop_next()
+        serviced.append((p, max(0, int(current_time - p.booking_time))))
+        current_time += duration
         if progress_callback:
-            try: progress_callback(i+1, how_many)
+            try: progress_callback(len(serviced), total)
             except Exception: pass
+    return serviced
 
-    serviced = []
-    current_time = now
-    while hq.size() > 0:
-        for d in range(doctors):
-            p = hq.pop_next()
-            if p is None: break
-            waiting_time = max(0, int(current_time - p.booking_time))
-            serviced.append((p, waiting_time))
-            current_time += rng.randint(3, 8)
-            if progress_callback:
-                try: progress_callback(len(serviced), how_many)
-                except Exception: pass
-        if len(serviced) >= how_many: break
+def simulate_live_and_export(hq: HospitalQueue = None, how_many=30, doctors=2, arrival_interval=(1,4),
+                             export_name="simulation_serviced.csv", progress_callback=None, seed=None):
+    # `hq` is kept only so existing positional calls still bind correctly. It is ignored: the
+    # simulation generates its own arrivals on a SimulatedQueue, so patients already in `hq` are
+    # NOT simulated or exported (previously they were serviced along with the generated ones),
+    # and `hq` is left untouched.
+    if hq is not None:
+        warnings.warn("simulate_live_and_export ignores its hq argument: patients already in it are "
+                      "no longer simulated or exported, and the queue is left untouched; omit it",
+                      DeprecationWarning, stacklevel=2)
+    rng = random.Random(seed) if seed is not None else random.Random()
+    now = time.time()
+    hq = SimulatedQueue(how_many, now)
+    _generate_arrivals(hq, how_many, rng, arrival_interval, progress_callback)
+    serviced = _service_arrivals(hq, now, rng, progress_callback)
 
     filepath = os.path.join(DESKTOP_PATH, export_name)
-    with open(filepath, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["id","name","age","severity","urgency","appointment_type","booking_time","wait_seconds"])
-        for p, w in serviced:
-            writer.writerow([p.id, p.name, p.age, p.severity, p.urgency, p.appointment_type,
-                             time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(p.booking_time)), w])
+    # Simulated booking seconds are almost all distinct, so the shared time cache would only add overhead.
+    strftime, localtime = time.strftime, time.localtime
+    lines = [f"{p.id},{p.name},{p.age},{p.severity},{p.urgency},{p.appointment_type},"
+             f"{strftime('%Y-%m-%d %H:%M:%S', localtime(p.booking_time))},{w}" for p, w in serviced]
+    _write_csv(filepath, ["id","name","age","severity","urgency","appointment_type","booking_time","wait_seconds"], lines)
     return filepath, serviced
 
 # -------------------------
@@ -148,6 +345,12 @@ class App:
         self.root.title("Smart Hospital Queue Optimization System")
         self.root.geometry("950x600")
         self.hq = HospitalQueue()
+        self._dirty = False
+        self._refresh_pending = False
+        self._rendered = []
+        self._progress_pending = False
+        self._progress = (0, 0)
+        self._last_progress_post = 0.0
         self._create_widgets()
         self._populate_sample_patients()
 
@@ -210,12 +413,12 @@ class App:
             messagebox.showwarning("Input error", "Check age/severity/urgency ranges."); return
         appt = self.appt_var.get(); notes = self.notes_txt.get("1.0", tk.END).strip()
         p = self.hq.add_patient(name, age, severity, urgency, appt, notes)
-        self.status_var.set(f"Added patient {p.summary()}"); self._refresh_queue_view()
+        self.status_var.set(f"Added patient {p.summary()}"); self._mark_dirty()
 
     def call_next(self):
         p = self.hq.pop_next()
         if p is None: messagebox.showinfo("No patients", "Queue is empty."); return
-        messagebox.showinfo("Calling Next", f"Call patient:\n{p.summary()}"); self.status_var.set(f"Called {p.name}"); self._refresh_queue_view()
+        messagebox.showinfo("Calling Next", f"Call patient:\n{p.summary()}"); self.status_var.set(f"Called {p.name}"); self._mark_dirty()
 
     def peek_next(self):
         p = self.hq.peek_next()
@@ -234,26 +437,57 @@ class App:
         except Exception: messagebox.showwarning("Input error", "Simulation inputs must be integers."); return
         if n <= 0 or docs <= 0: messagebox.showwarning("Input error", "Arrivals and doctors must be positive."); return
         self.sim_button.config(state="disabled"); self.status_var.set("Scheduling simulation...")
-        t = threading.Thread(target=self._run_simulation, args=(n, docs), daemon=True); t.start()
+        t = threading.Thread(target=self._run_simulation, args=(n, docs), name="hq-sim", daemon=True); t.start()
+
+    @staticmethod
+    def _pin_worker_cpu():
+        # Linux only: keep the calling worker thread on one core (the last one available to the
+        # process) so it does not migrate; silently skipped elsewhere or on single-core machines.
+        if not hasattr(os, "sched_setaffinity"): return
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+            if len(cpus) > 1: os.sched_setaffinity(0, {cpus[-1]})
+        except OSError: pass
 
     def _run_simulation(self, n, docs):
-        self.root.after(0, lambda: self.status_var.set("Simulation running..."))
-        self.root.after(0, lambda: self.sim_progress.config(text="0/%d" % n))
-        sim_hq = HospitalQueue()
+        self._pin_worker_cpu()
+        # Each UI update is marshalled to the Tk thread as a single after() event.
+        self.root.after(0, self._sim_started, n)
         try:
-            filepath, serviced = simulate_live_and_export(sim_hq, how_many=n, doctors=docs, progress_callback=self._sim_progress)
-            self.root.after(0, lambda: self.status_var.set(f"Simulation complete: {len(serviced)} serviced."))
-            self.root.after(0, lambda: self.sim_button.config(state="normal"))
-            self.root.after(0, lambda: messagebox.showinfo("Simulation finished", f"Serviced {len(serviced)} patients.\nExport saved to:\n{filepath}"))
+            filepath, serviced = simulate_live_and_export(how_many=n, doctors=docs, progress_callback=self._sim_progress)
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Simulation error", f"{e}"))
-            self.root.after(0, lambda: self.sim_button.config(state="normal"))
-            self.root.after(0, lambda: self.status_var.set("Simulation failed"))
-        finally: self.root.after(0, lambda: self.sim_progress.config(text=""))
+            self.root.after(0, self._sim_failed, e)
+        else:
+            self.root.after(0, self._sim_done, filepath, len(serviced))
+
+    def _sim_started(self, n):
+        self.status_var.set("Simulation running..."); self.sim_progress.config(text="0/%d" % n)
+
+    def _sim_done(self, filepath, n_serviced):
+        self.sim_button.config(state="normal"); self.sim_progress.config(text="")
+        self.status_var.set(f"Simulation complete: {n_serviced} serviced."); self._mark_dirty()
+        messagebox.showinfo("Simulation finished", f"Serviced {n_serviced} patients.\nExport saved to:\n{filepath}")
+
+    def _sim_failed(self, error):
+        self.sim_button.config(state="normal"); self.sim_progress.config(text="")
+        self.status_var.set("Simulation failed")
+        messagebox.showerror("Simulation error", f"{error}")
 
     def _sim_progress(self, done, total):
-        try: self.root.after(0, lambda: self.sim_progress.config(text=f"{done}/{total}"))
-        except Exception: pass
+        # Called from the worker thread; post at most one update per PROGRESS_INTERVAL
+        # (the final count always goes through) and keep at most one queued on the Tk loop.
+        self._progress = (done, total)
+        now = time.monotonic()
+        if self._progress_pending or (now - self._last_progress_post < PROGRESS_INTERVAL and done < total): return
+        self._last_progress_post = now
+        self._progress_pending = True
+        try: self.root.after(0, self._apply_progress)
+        except Exception: self._progress_pending = False
+
+    def _apply_progress(self):
+        self._progress_pending = False
+        done, total = self._progress
+        self.sim_progress.config(text=f"{done}/{total}")
 
     def show_stats(self):
         size=self.hq.size(); peek=self.hq.peek_next()
@@ -262,19 +496,41 @@ class App:
 
     def clear_queue(self):
         if messagebox.askyesno("Confirm", "Clear the whole queue?"):
-            self.hq.clear(); self._refresh_queue_view(); self.status_var.set("Queue cleared")
+            self.hq.clear(); self._mark_dirty(); self.status_var.set("Queue cleared")
+
+    def _mark_dirty(self):
+        # Coalesce bursts of mutations into a single redraw instead of polling on a timer.
+        self._dirty = True
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after(200, self._maybe_refresh)
+
+    def _maybe_refresh(self):
+        self._refresh_pending = False
+        if self._dirty:
+            self._dirty = False
+            self._refresh_queue_view()
 
     def _refresh_queue_view(self):
-        self.queue_listbox.delete(0, tk.END)
-        for p in self.hq.list_queue(): self.queue_listbox.insert(tk.END, p.summary())
-        self.root.after(1500, self._refresh_queue_view)
+        # Only touch the rows between the unchanged head and tail of the previous render.
+        old = self._rendered
+        new = [p.summary() for p in self.hq.top_k(QUEUE_VIEW_LIMIT)]
+        limit = min(len(old), len(new))
+        head = 0
+        while head < limit and old[head] == new[head]: head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == new[-1 - tail]: tail += 1
+        if head < len(old) - tail: self.queue_listbox.delete(head, len(old) - tail - 1)
+        changed = new[head:len(new) - tail]
+        # Listbox.insert takes varargs, so all changed rows go over in a single Tcl call.
+        if changed: self.queue_listbox.insert(head, *changed)
+        self._rendered = new
 
     def _populate_sample_patients(self):
         samples=[("Rohit",65,2,6,"appointment"),("Sana",30,4,9,"emergency"),("Kavi",8,3,8,"walk-in"),
                  ("Maya",50,1,3,"walk-in"),("Arjun",72,2,5,"walk-in"),("Priya",25,4,10,"appointment")]
-        self.hq.clear()
-        for name, age, sev, urg, appt in samples: self.hq.add_patient(name, age, sev, urg, appt)
-        self.status_var.set("Sample patients loaded")
+        self.hq.bulk_load(samples)
+        self.status_var.set("Sample patients loaded"); self._mark_dirty()
 
 def main():
     root = tk.Tk()